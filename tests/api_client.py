@@ -4,6 +4,7 @@ API клиент с интеграцией валидации схем
 
 from typing import Dict, Any, Union
 import requests
+from requests.adapters import HTTPAdapter
 from dataclasses import dataclass
 import logging
 import os
@@ -62,7 +63,7 @@ class APIResponse:
         with allure.step(f"Validate response schema: {schema_name}"):
             try:
                 schemas.validate(schema_name, self.json_data)
-                logger.debug(f"Schema validation passed: {schema_name}")
+                logger.debug("Schema validation passed: %s", schema_name)
             except Exception as e:
                 allure.attach(
                     str(self.json_data),
@@ -148,23 +149,36 @@ class ReqresAPIClient:
     - Настройка в зависимости от окружения
     """
 
-    def __init__(self, environment: Environment):
+    def __init__(self, environment: Environment, pool_size: int = 32):
 
         self.env = environment
         self.session = requests.Session()
         self.session.timeout = environment.timeout
         self.session.headers.update(
-            {"Content-Type": "application/json", "Accept": "application/json"}
+            {
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Connection": "keep-alive",
+            }
         )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        logger.info("API Client initialized: %s", environment.base_url)
 
-        logger.info(f"API Client initialized: {environment.base_url}")
+    def close(self) -> None:
+        """Закрывает пул соединений"""
+        self.session.close()
 
     def request(self, method: str, endpoint: str, **kwargs) -> APIResponse:
         """Внутренний метод запроса с логированием"""
         url = f"{self.env.base_url}{endpoint}"
 
         with allure.step(f"{method.upper()} {endpoint}"):
-            logger.debug(f"{method.upper()} {url} | {kwargs}")
+            logger.debug("%s %s | %s", method.upper(), url, kwargs)
 
             response = self.session.request(method, url, **kwargs)
 
@@ -384,14 +398,14 @@ class TestDataManager:
             try:
                 self.api.users().delete(user_id)
             except Exception as e:
-                logger.warning(f"Failed to cleanup user {user_id}: {e}")
+                logger.warning("Failed to cleanup user %s: %s", user_id, e)
 
         for resource_id in self.created_resources:
 
             try:
                 self.api.resources().delete(resource_id)
             except Exception as e:
-                logger.warning(f"Failed to cleanup resource {resource_id}: {e}")
+                logger.warning("Failed to cleanup resource %s: %s", resource_id, e)
 
         self.created_users.clear()
         self.created_resources.clear()
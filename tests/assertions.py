@@ -1,9 +1,11 @@
 import allure
 import logging
+import orjson
 from typing import Dict, Any, Sequence
 from http import HTTPStatus
 import requests
 from fastapi_pagination import Page
+from pydantic import TypeAdapter
 from sqlmodel import Session
 from app.models import (
     SingleUserResponse,
@@ -22,6 +24,26 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# ========================================
+# МОДЕЛИ ОТВЕТОВ ДЛЯ ТЕСТОВ
+# ========================================
+
+
+class CreatedUserResponse(UserResponse):
+    """Ответ создания пользователя: API отдает ID строкой, тестам нужен int"""
+
+    id: int
+
+
+# Валидаторы ответов собираются один раз при импорте и переиспользуются
+CREATED_USER_ADAPTER = TypeAdapter(CreatedUserResponse)
+USER_RESPONSE_ADAPTER = TypeAdapter(UserResponse)
+SINGLE_USER_ADAPTER = TypeAdapter(SingleUserResponse)
+SINGLE_RESOURCE_ADAPTER = TypeAdapter(SingleResourceResponse)
+USERS_PAGE_ADAPTER = TypeAdapter(Page[User])
+RESOURCES_PAGE_ADAPTER = TypeAdapter(Page[Resource])
+
+
 # ========================================
 # ХЕЛПЕРЫ ДЛЯ РАБОТЫ С БД (вместо database layer)
 # ========================================
@@ -35,7 +57,7 @@ def get_user_from_db(user_id: int) -> User | None:
         with Session(engine) as session:
             return session.get(User, user_id)
     except Exception as e:
-        logger.error(f"Error getting user {user_id}: {e}")
+        logger.error("Error getting user %s: %s", user_id, e)
         return None
 
 
@@ -47,7 +69,7 @@ def get_resource_from_db(resource_id: int) -> Resource | None:
         with Session(engine) as session:
             return session.get(Resource, resource_id)
     except Exception as e:
-        logger.error(f"Error getting resource {resource_id}: {e}")
+        logger.error("Error getting resource %s: %s", resource_id, e)
         return None
 
 
@@ -67,9 +89,14 @@ class APIAssertions:
             try:
                 curl_cmd = curlify.to_curl(response.request)
                 allure.attach(curl_cmd, title, allure.attachment_type.TEXT)
-                logger.debug(f"cURL: {curl_cmd}")
+                logger.debug("cURL: %s", curl_cmd)
             except Exception as e:
-                logger.warning(f"Failed to generate cURL: {e}")
+                logger.warning("Failed to generate cURL: %s", e)
+
+    @staticmethod
+    def parse_json(response: requests.Response) -> Any:
+        """Разбирает тело ответа через orjson"""
+        return orjson.loads(response.content)
 
     @staticmethod
     def log_and_check_status(
@@ -82,7 +109,10 @@ class APIAssertions:
             f"Verify HTTP status for {response.request.method} {endpoint}"
         ):
             logger.info(
-                f"{response.request.method} {endpoint} - Status: {response.status_code}"
+                "%s %s - Status: %s",
+                response.request.method,
+                endpoint,
+                response.status_code,
             )
 
             # Логируем cURL при ошибках
@@ -150,7 +180,7 @@ class APIAssertions:
         """Проверяет 404 ошибку"""
         with allure.step(f"Verify 404 error for {endpoint}"):
             cls.log_and_check_status(response, endpoint, HTTPStatus.NOT_FOUND)
-            data = response.json()
+            data = cls.parse_json(response)
 
             assert "detail" in data, "Missing 'detail' in 404 response"
             assert "error" in data["detail"], "Missing 'error' in detail"
@@ -188,7 +218,10 @@ class APIAssertions:
             cls.check_unique_ids(items, "user")
 
             logger.info(
-                f"Users list business logic validated: {total} total, {len(items)} on page {page}"
+                "Users list business logic validated: %s total, %s on page %s",
+                total,
+                len(items),
+                page,
             )
 
     @classmethod
@@ -214,7 +247,7 @@ class APIAssertions:
             ), f"Resource pantone mismatch"
 
             logger.info(
-                f"Resource business logic validated: {data['name']} ({data['year']})"
+                "Resource business logic validated: %s (%s)", data["name"], data["year"]
             )
 
     @classmethod
@@ -241,7 +274,10 @@ class APIAssertions:
             assert user_id_int > 0, f"User ID should be positive: {user_id_int}"
 
             logger.info(
-                f"User creation business logic validated: {name} ({job}) with ID {user_id_int}"
+                "User creation business logic validated: %s (%s) with ID %s",
+                name,
+                job,
+                user_id_int,
             )
             return user_id_int
 
@@ -274,7 +310,10 @@ class APIAssertions:
                 ), f"Too many items on page: {len(items)} > {max_items_on_page}"
 
             logger.info(
-                f"Pagination calculations verified: page {page}/{pages}, {len(items)} items"
+                "Pagination calculations verified: page %s/%s, %s items",
+                page,
+                pages,
+                len(items),
             )
 
     @classmethod
@@ -303,11 +342,14 @@ class APIAssertions:
                 assert user_id > 0, f"User ID should be positive: {user_id}"
                 result["user_id"] = user_id
                 logger.info(
-                    f"Authentication business logic validated: token length {len(token)}, user ID {user_id}"
+                    "Authentication business logic validated: token length %s, user ID %s",
+                    len(token),
+                    user_id,
                 )
             else:
                 logger.info(
-                    f"Authentication business logic validated: token length {len(token)}"
+                    "Authentication business logic validated: token length %s",
+                    len(token),
                 )
 
             return result
@@ -373,7 +415,7 @@ class APIAssertions:
             )
 
             logger.info(
-                f"System health business logic validated: {status} (v{version})"
+                "System health business logic validated: %s (v%s)", status, version
             )
 
     @classmethod
@@ -396,7 +438,7 @@ class APIAssertions:
                     expected_error_pattern.lower() in error_message.lower()
                 ), f"Expected error pattern '{expected_error_pattern}' not found in '{error_message}'"
 
-            logger.info(f"API error business logic validated: {error_message}")
+            logger.info("API error business logic validated: %s", error_message)
 
     # ========================================
     # ПРОВЕРКИ БД ДЛЯ ПОЛЬЗОВАТЕЛЕЙ
@@ -429,7 +471,10 @@ class APIAssertions:
             assert "@" in db_user.email, f"DB email format invalid: {db_user.email}"
 
             logger.info(
-                f"User {user_id} verified in database: {db_user.first_name} {db_user.last_name}"
+                "User %s verified in database: %s %s",
+                user_id,
+                db_user.first_name,
+                db_user.last_name,
             )
             return db_user
 
@@ -442,7 +487,7 @@ class APIAssertions:
                 db_user is None
             ), f"User {user_id} should be deleted but still exists in database"
 
-            logger.info(f"User {user_id} confirmed deleted from database")
+            logger.info("User %s confirmed deleted from database", user_id)
 
     @staticmethod
     def check_user_updated_in_database(
@@ -477,7 +522,10 @@ class APIAssertions:
             ), f"DB avatar should not change: '{updated_user.avatar}' != '{original_user.avatar}'"
 
             logger.info(
-                f"User {user_id} updated in database: {updated_user.first_name} {updated_user.last_name}"
+                "User %s updated in database: %s %s",
+                user_id,
+                updated_user.first_name,
+                updated_user.last_name,
             )
             return updated_user
 
@@ -511,7 +559,10 @@ class APIAssertions:
                 ), f"DB pantone_value mismatch: '{db_resource.pantone_value}' != '{expected_data['pantone_value']}'"
 
             logger.info(
-                f"Resource {resource_id} verified in database: {db_resource.name} ({db_resource.year})"
+                "Resource %s verified in database: %s (%s)",
+                resource_id,
+                db_resource.name,
+                db_resource.year,
             )
             return db_resource
 
@@ -524,7 +575,7 @@ class APIAssertions:
                 db_resource is None
             ), f"Resource {resource_id} should be deleted but still exists in database"
 
-            logger.info(f"Resource {resource_id} confirmed deleted from database")
+            logger.info("Resource %s confirmed deleted from database", resource_id)
 
     @staticmethod
     def check_resource_updated_in_database(
@@ -551,7 +602,10 @@ class APIAssertions:
             ), f"DB pantone_value not updated: '{updated_resource.pantone_value}' != '{expected_data['pantone_value']}'"
 
             logger.info(
-                f"Resource {resource_id} updated in database: {updated_resource.name} ({updated_resource.year})"
+                "Resource %s updated in database: %s (%s)",
+                resource_id,
+                updated_resource.name,
+                updated_resource.year,
             )
             return updated_resource
 
@@ -566,7 +620,7 @@ class APIAssertions:
         endpoint: str,
         expected_name: str,
         expected_job: str,
-    ) -> UserResponse:
+    ) -> CreatedUserResponse:
         """Проверяет ответ создания пользователя (API + БД)"""
         with allure.step(f"Send POST request to create user: {expected_name}"):
             pass
@@ -574,7 +628,7 @@ class APIAssertions:
         with allure.step("Verify user creation API response"):
             # 1. API проверка
             cls.log_and_check_status(response, endpoint, HTTPStatus.CREATED)
-            create_response = UserResponse(**response.json())
+            create_response = CREATED_USER_ADAPTER.validate_json(response.content)
 
             assert (
                 create_response.name == expected_name
@@ -582,10 +636,9 @@ class APIAssertions:
             assert (
                 create_response.job == expected_job
             ), f"Job mismatch: {create_response.job} != {expected_job}"
-            assert create_response.id is not None, "ID should not be None"
             assert create_response.createdAt is not None, "CreatedAt should not be None"
 
-            user_id = int(create_response.id)
+            user_id = create_response.id
             assert (
                 user_id > 0
             ), f"ID должен быть положительным числом, получен: {user_id}"
@@ -613,7 +666,7 @@ class APIAssertions:
         with allure.step("Verify user update API response"):
             # 1. API проверка
             cls.log_and_check_status(response, endpoint, HTTPStatus.OK)
-            update_response = UserResponse(**response.json())
+            update_response = USER_RESPONSE_ADAPTER.validate_json(response.content)
 
             assert (
                 update_response.name == expected_name
@@ -665,7 +718,7 @@ class APIAssertions:
         with allure.step("Verify resource creation API response"):
             # 1. API проверка
             cls.log_and_check_status(response, endpoint, HTTPStatus.CREATED)
-            data = response.json()
+            data = cls.parse_json(response)
 
             assert data["name"] == expected_resource["name"]
             assert data["year"] == expected_resource["year"]
@@ -700,7 +753,7 @@ class APIAssertions:
         with allure.step("Verify resource update API response"):
             # 1. API проверка
             cls.log_and_check_status(response, endpoint, HTTPStatus.OK)
-            data = response.json()
+            data = cls.parse_json(response)
 
             assert data["name"] == expected_resource["name"]
             assert data["year"] == expected_resource["year"]
@@ -741,7 +794,7 @@ class APIAssertions:
         """Проверяет ответ с одним пользователем"""
         with allure.step("Verify single user API response"):
             cls.log_and_check_status(response, endpoint, HTTPStatus.OK)
-            user_response = SingleUserResponse(**response.json())
+            user_response = SINGLE_USER_ADAPTER.validate_json(response.content)
 
             return user_response
 
@@ -752,7 +805,7 @@ class APIAssertions:
         """Проверяет ответ с одним ресурсом"""
         with allure.step("Verify single resource API response"):
             cls.log_and_check_status(response, endpoint, HTTPStatus.OK)
-            resource_response = SingleResourceResponse(**response.json())
+            resource_response = SINGLE_RESOURCE_ADAPTER.validate_json(response.content)
 
             return resource_response
 
@@ -767,19 +820,11 @@ class APIAssertions:
         """Проверяет ответ со списком пользователей"""
         with allure.step("Verify users list API response"):
             cls.log_and_check_status(response, endpoint, HTTPStatus.OK)
-            data = response.json()
+            data = cls.parse_json(response)
 
             cls.check_pagination_structure(data, page, per_page)
 
-            users = [User(**user_data) for user_data in data["items"]]
-
-            return Page(
-                items=users,
-                page=data["page"],
-                size=data["size"],
-                total=data["total"],
-                pages=data["pages"],
-            )
+            return USERS_PAGE_ADAPTER.validate_python(data)
 
     @classmethod
     def check_resources_list_response(
@@ -792,19 +837,11 @@ class APIAssertions:
         """Проверяет ответ со списком ресурсов"""
         with allure.step("Verify resources list API response"):
             cls.log_and_check_status(response, endpoint, HTTPStatus.OK)
-            data = response.json()
+            data = cls.parse_json(response)
 
             cls.check_pagination_structure(data, page, per_page)
 
-            resources = [Resource(**resource_data) for resource_data in data["items"]]
-
-            return Page(
-                items=resources,
-                page=data["page"],
-                size=data["size"],
-                total=data["total"],
-                pages=data["pages"],
-            )
+            return RESOURCES_PAGE_ADAPTER.validate_python(data)
 
     # ========================================
     # АУТЕНТИФИКАЦИЯ (test_auth.py)
@@ -817,7 +854,7 @@ class APIAssertions:
         """Проверяет успешный ответ регистрации"""
         with allure.step("Verify successful registration API response"):
             cls.log_and_check_status(response, endpoint, HTTPStatus.CREATED)
-            data = response.json()
+            data = cls.parse_json(response)
 
             assert "id" in data, "Missing 'id' in registration response"
             assert "token" in data, "Missing 'token' in registration response"
@@ -831,7 +868,7 @@ class APIAssertions:
             assert data["id"] > 0, f"ID should be positive, got {data['id']}"
             assert len(data["token"]) > 0, "Token should not be empty"
 
-            logger.info(f"Registration successful: ID={data['id']}")
+            logger.info("Registration successful: ID=%s", data["id"])
             return data
 
     @classmethod
@@ -841,7 +878,7 @@ class APIAssertions:
         """Проверяет успешный ответ логина"""
         with allure.step("Verify successful login API response"):
             cls.log_and_check_status(response, endpoint, HTTPStatus.OK)
-            data = response.json()
+            data = cls.parse_json(response)
 
             assert "token" in data, "Missing 'token' in login response"
             assert isinstance(
@@ -859,7 +896,7 @@ class APIAssertions:
         """Проверяет ошибку с email"""
         with allure.step(f"Verify email validation error for {endpoint}"):
             cls.log_and_check_status(response, endpoint, HTTPStatus.BAD_REQUEST)
-            data = response.json()
+            data = cls.parse_json(response)
 
             assert "detail" in data, "Missing 'detail' in error response"
             assert "error" in data["detail"], "Missing 'error' in detail"
@@ -878,7 +915,7 @@ class APIAssertions:
         """Проверяет delayed response"""
         with allure.step(f"Verify delayed response (min {min_duration}s)"):
             cls.log_and_check_status(response, endpoint, HTTPStatus.OK)
-            data = response.json()
+            data = cls.parse_json(response)
 
             assert "page" in data, "Missing 'page' in response"
             assert "size" in data, "Missing 'size' in response"
@@ -889,7 +926,7 @@ class APIAssertions:
             assert isinstance(data["items"], list), "Items should be a list"
             assert len(data["items"]) > 0, "Items array should not be empty"
 
-            logger.info(f"Delayed response validated, took at least {min_duration}s")
+            logger.info("Delayed response validated, took at least %ss", min_duration)
 
     # ========================================
     # УНИВЕРСАЛЬНЫЕ ХЕЛПЕРЫ
@@ -900,16 +937,14 @@ class APIAssertions:
         """Проверяет уникальность ID в списке объектов или словарей"""
         with allure.step(f"Verify unique IDs in {item_name} list"):
             # Поддержка как объектов с атрибутами, так и словарей
-            if items_list and hasattr(items_list[0], "id"):
-                ids = [item.id for item in items_list]
-            else:
-                ids = [item["id"] for item in items_list]
-
-            unique_ids = set(ids)
+            use_attr = bool(items_list) and hasattr(items_list[0], "id")
 
-            assert len(ids) == len(
-                unique_ids
-            ), f"Found duplicate {item_name} IDs: {ids}"
+            # Один проход с выходом на первом дубликате
+            seen = set()
+            for item in items_list:
+                item_id = item.id if use_attr else item["id"]
+                assert item_id not in seen, f"Found duplicate {item_name} ID: {item_id}"
+                seen.add(item_id)
 
     @staticmethod
     def check_multiple_fields(obj: Any, **field_expectations) -> None:
@@ -941,7 +976,10 @@ class APIAssertions:
             )
 
             logger.info(
-                f"Pages calculation correct: {page_obj.total} total / {size} size = {page_obj.pages} pages"
+                "Pages calculation correct: %s total / %s size = %s pages",
+                page_obj.total,
+                size,
+                page_obj.pages,
             )
 
     @staticmethod
@@ -957,7 +995,10 @@ class APIAssertions:
                 ), f"Items count wrong: expected {expected_items}, got {actual_items} (page={page}, size={size})"
 
                 logger.info(
-                    f"Items count correct: page {page} has {actual_items} items (expected {expected_items})"
+                    "Items count correct: page %s has %s items (expected %s)",
+                    page,
+                    actual_items,
+                    expected_items,
                 )
 
     @staticmethod
@@ -999,7 +1040,7 @@ class APIAssertions:
                 combined_items, f"{entity_type} across pages"
             )
 
-            logger.info(f"Different pages contain unique {entity_type} data")
+            logger.info("Different pages contain unique %s data", entity_type)
 
     @staticmethod
     def check_pagination_empty_page(page_obj: Any) -> None:
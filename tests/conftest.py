@@ -5,14 +5,22 @@
 
 import allure
 import dotenv
+import functools
 import pytest
 import requests
 import os
+import random
 import sys
-from typing import Dict, Optional, Any, Generator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, List, Optional, Any, Generator, Tuple
+from fastapi_pagination import Page
 from mimesis import Person, Text, Numeric
 
+from app.models import User, Resource
 from tests.api_client import ReqresAPIClient, Environment, TestDataManager
+from tests.assertions import APIAssertions
 
 
 # ===================================
@@ -31,6 +39,11 @@ def pytest_addoption(parser):
     parser.addoption(
         "--skip-cleanup", action="store_true", help="Skip automatic test data cleanup"
     )
+    parser.addoption(
+        "--no-allure",
+        action="store_true",
+        help="Disable Allure decorators and results even if --alluredir is set",
+    )
 
 
 @pytest.fixture(autouse=True)
@@ -71,10 +84,14 @@ def health_check(environment: Environment) -> None:
         pytest.exit(f"Service unavailable on {environment.base_url}: {e}")
 
 
-@pytest.fixture
-def api(environment: Environment, health_check) -> ReqresAPIClient:
-    """Основной экземпляр API клиента"""
-    return ReqresAPIClient(environment)
+@pytest.fixture(scope="session")
+def api(
+    environment: Environment, health_check
+) -> Generator[ReqresAPIClient, None, None]:
+    """Основной экземпляр API клиента (одна сессия requests на весь прогон)"""
+    client = ReqresAPIClient(environment)
+    yield client
+    client.close()
 
 
 @pytest.fixture
@@ -99,11 +116,28 @@ def base_url(environment: Environment) -> str:
     return environment.base_url
 
 
-@pytest.fixture
-def api_client(environment: Environment, health_check):
-    """Legacy API клиент для обратной совместимости"""
+@pytest.fixture(scope="session")
+def api_client(
+    environment: Environment, health_check
+) -> Generator["APIClient", None, None]:
+    """Legacy API клиент для обратной совместимости (одно соединение на сессию)"""
+    client = APIClient(environment.base_url)
+    # Прогреваем пул, чтобы первый тест не платил за холодное соединение
+    try:
+        client.get("/api/users", params={"page": 1, "size": 1})
+    except requests.RequestException:
+        # Прогрев не обязателен, реальные ошибки покажут сами тесты
+        pass
+    yield client
+    client.close()
 
-    return APIClient(environment.base_url)
+
+@pytest.fixture(scope="session")
+def status_client(environment: Environment) -> Callable[[], requests.Response]:
+    """Легковесный запрос /status без health check и общего пула соединений"""
+    return functools.partial(
+        requests.get, f"{environment.base_url}/status", timeout=environment.timeout
+    )
 
 
 @pytest.fixture
@@ -117,9 +151,15 @@ def reqres_api(api: ReqresAPIClient) -> ReqresAPIClient:
 # ===================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def rng() -> random.Random:
+    """Воспроизводимый генератор случайных чисел, свой для каждого xdist воркера"""
+    return random.Random(os.getenv("PYTEST_XDIST_WORKER", "master"))
+
+
+@pytest.fixture(scope="session")
 def fake() -> Dict[str, Any]:
-    """Генераторы фейковых данных"""
+    """Генераторы фейковых данных (создаются один раз за сессию)"""
     return {"person": Person(), "text": Text(), "numeric": Numeric()}
 
 
@@ -174,6 +214,56 @@ def valid_auth_data() -> Dict[str, str]:
     return {"email": "test@example.com", "password": "securepass123"}
 
 
+# ===================================
+# КЕШИРОВАННЫЕ ОТВЕТЫ API
+# ===================================
+
+
+@pytest.fixture(scope="session")
+def users_page(api_client) -> Page[User]:
+    """Список пользователей (page=1, size=50), запрашивается один раз за сессию"""
+    response = api_client.get("/api/users", params={"page": 1, "size": 50})
+    return APIAssertions.check_users_list_response(
+        response, "/api/users", page=1, per_page=50
+    )
+
+
+@pytest.fixture(scope="session")
+def users_page_1(api_client) -> Page[User]:
+    """Первая страница пользователей (page=1, size=6), валидируется один раз за сессию"""
+    response = api_client.get("/api/users", params={"page": 1, "size": 6})
+    return APIAssertions.check_users_list_response(
+        response, "/api/users?page=1", page=1, per_page=6
+    )
+
+
+@pytest.fixture(scope="session")
+def resources_page_1(api_client) -> Page[Resource]:
+    """Первая страница ресурсов (page=1, size=6), валидируется один раз за сессию"""
+    response = api_client.get("/api/resources", params={"page": 1, "size": 6})
+    return APIAssertions.check_resources_list_response(
+        response, "/api/resources?page=1", page=1, per_page=6
+    )
+
+
+@pytest.fixture(scope="module")
+def status_response(api_client) -> requests.Response:
+    """Ответ /status, запрашивается один раз на модуль"""
+    return api_client.get("/status")
+
+
+@pytest.fixture(scope="session")
+def created_user(api_client) -> int:
+    """ID пользователя, созданного один раз за сессию (на xdist-воркер) для тестов чтения"""
+    test_user = {"name": "TestUser", "job": "TestJob"}
+    response = api_client.post("/api/users", json=test_user)
+    # Хелпер уже разобрал тело ответа, повторный json() не нужен
+    created = APIAssertions.check_create_user_response(
+        response, "/api/users", test_user["name"], test_user["job"]
+    )
+    return created.id
+
+
 # ===================================
 # ПАРАМЕТРИЗОВАННЫЕ ТЕСТОВЫЕ ДАННЫЕ
 # ===================================
@@ -199,14 +289,51 @@ def user_test_cases(request) -> tuple:
     return request.param
 
 
+@dataclass(frozen=True)
+class PaginationCase:
+    """Случай пагинации с заранее собранными параметрами запроса"""
+
+    id: str
+    params: Dict[str, int]
+    query: str
+
+
+def make_pagination_case(page: int, size: int) -> PaginationCase:
+    """Собирает id, параметры и строку запроса один раз при импорте"""
+    return PaginationCase(
+        id=f"p{page}s{size}".replace("-", "m"),
+        params={"page": page, "size": size},
+        query=f"?page={page}&size={size}",
+    )
+
+
+INVALID_PAGINATION_CASES = tuple(
+    make_pagination_case(page, size)
+    for page, size in [(0, 6), (-1, 6), (1, 0), (1, -5)]
+)
+
+
+def pytest_generate_tests(metafunc):
+    """Параметризует тесты с фикстурой invalid_pagination_case"""
+    if "invalid_pagination_case" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "invalid_pagination_case",
+            INVALID_PAGINATION_CASES,
+            ids=[case.id for case in INVALID_PAGINATION_CASES],
+        )
+
+
 # ===================================
 # КОНФИГУРАЦИЯ ALLURE ОТЧЕТНОСТИ
 # ===================================
 
 
 @pytest.fixture(scope="session", autouse=True)
-def allure_environment(environment: Environment):
+def allure_environment(request, environment: Environment):
     """Настраивает свойства окружения для Allure"""
+    allure_dir = request.config.getoption("--alluredir", default=None)
+    if not allure_dir:
+        return
 
     db_engine = os.getenv("DATABASE_ENGINE", "Not specified")
     if db_engine != "Not specified":
@@ -229,7 +356,6 @@ def allure_environment(environment: Environment):
     ]
 
     # Создаем файл окружения для allure
-    allure_dir = "allure-results"
     os.makedirs(allure_dir, exist_ok=True)
 
     with open(f"{allure_dir}/environment.properties", "w") as f:
@@ -267,10 +393,46 @@ def pytest_runtest_makereport(item, call):
         )
 
 
+# Декораторы меток Allure, которые отключаются, если отчет не собирается
+ALLURE_DECORATORS = (
+    "epic",
+    "feature",
+    "story",
+    "title",
+    "description",
+    "severity",
+    "tag",
+    "label",
+    "link",
+    "issue",
+    "testcase",
+)
+
+
+def disable_allure_decorators() -> None:
+    """Заменяет декораторы Allure на no-op до импорта тестовых модулей"""
+
+    def noop(*args, **kwargs):
+        return lambda func: func
+
+    for name in ALLURE_DECORATORS:
+        setattr(allure, name, noop)
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     """Настраивает категории Allure и маркеры"""
     import json
 
+    # --no-allure или ALLURE_OFF=1 отключают Allure даже при --alluredir из addopts.
+    # Хук выполняется раньше плагина allure-pytest, поэтому тот не пишет результаты
+    if config.getoption("--no-allure", default=False) or os.getenv("ALLURE_OFF") == "1":
+        config.option.allure_report_dir = None
+
+    # Без --alluredir метаданные тестов никто не читает
+    if not config.getoption("--alluredir", default=None):
+        disable_allure_decorators()
+
     # Категории ошибок для Allure
     categories = [
         {
@@ -295,11 +457,13 @@ def pytest_configure(config):
         },
     ]
 
-    allure_dir = "allure-results"
-    os.makedirs(allure_dir, exist_ok=True)
+    # Без каталога результатов Allure отключен и файлы не нужны
+    allure_dir = config.getoption("--alluredir", default=None)
+    if allure_dir:
+        os.makedirs(allure_dir, exist_ok=True)
 
-    with open(f"{allure_dir}/categories.json", "w") as f:
-        json.dump(categories, f, indent=2)
+        with open(f"{allure_dir}/categories.json", "w") as f:
+            json.dump(categories, f, indent=2)
 
     # Регистрируем кастомные маркеры
     config.addinivalue_line("markers", "smoke: Smoke тесты базовой функциональности")
@@ -318,8 +482,16 @@ def pytest_configure(config):
 class APIClient:
     """Legacy API клиент для обратной совместимости"""
 
-    def __init__(self, base_url: str) -> None:
+    def __init__(self, base_url: str, pool_size: int = 32) -> None:
         self.base_url = base_url
+        # Переиспользуем keep-alive соединения между запросами и тестами
+        self.session = requests.Session()
+        self.session.headers["Connection"] = "keep-alive"
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def get(
         self,
@@ -327,7 +499,7 @@ class APIClient:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
-        return requests.get(
+        return self.session.get(
             f"{self.base_url}{endpoint}", params=params, headers=headers
         )
 
@@ -338,7 +510,7 @@ class APIClient:
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
-        return requests.post(
+        return self.session.post(
             f"{self.base_url}{endpoint}", json=json, data=data, headers=headers
         )
 
@@ -349,7 +521,7 @@ class APIClient:
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
-        return requests.put(
+        return self.session.put(
             f"{self.base_url}{endpoint}", json=json, data=data, headers=headers
         )
 
@@ -360,11 +532,27 @@ class APIClient:
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
-        return requests.patch(
+        return self.session.patch(
             f"{self.base_url}{endpoint}", json=json, data=data, headers=headers
         )
 
     def delete(
         self, endpoint: str, headers: Optional[Dict[str, str]] = None
     ) -> requests.Response:
-        return requests.delete(f"{self.base_url}{endpoint}", headers=headers)
+        return self.session.delete(f"{self.base_url}{endpoint}", headers=headers)
+
+    def get_many(
+        self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[requests.Response]:
+        """Выполняет независимые GET запросы параллельно через общий пул соединений.
+        Ответы возвращаются в порядке запросов"""
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            return list(
+                executor.map(lambda call: self.get(call[0], params=call[1]), calls)
+            )
+
+    def close(self) -> None:
+        """Закрывает пул соединений"""
+        self.session.close()
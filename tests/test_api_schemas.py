@@ -18,6 +18,7 @@ logger = logging.getLogger(__name__)
 
 @allure.feature("API Validation & Business Logic: User Management")
 @pytest.mark.schema
+@pytest.mark.xdist_group("db_state")
 class TestUserManagementWithSchemas:
     """Проверка управления пользователями через fluent API с явной валидацией схем"""
 
@@ -71,7 +72,7 @@ class TestUserManagementWithSchemas:
             final_response = api.users().get(user_id).validate_single_user()
             assert final_response.status_code == 200, "User should exist after update"
 
-        logger.info(f"User lifecycle completed successfully for ID: {user_id}")
+        logger.info("User lifecycle completed successfully for ID: %s", user_id)
 
     @allure.title("Non-existent user error handling with schema validation")
     def test_user_not_found_validation(self, api):
@@ -103,6 +104,7 @@ class TestUserManagementWithSchemas:
 
 @allure.feature("API Validation & Business Logic: Resource Management")
 @pytest.mark.schema
+@pytest.mark.xdist_group("db_state")
 class TestResourceManagementWithSchemas:
     """Проверка управления ресурсами через fluent API с явной валидацией схем"""
 
@@ -144,7 +146,7 @@ class TestResourceManagementWithSchemas:
                     actual_value == value
                 ), f"Resource {key} update failed: {actual_value} != {value}"
 
-        logger.info(f"Resource operations completed for ID: {resource_id}")
+        logger.info("Resource operations completed for ID: %s", resource_id)
 
     @allure.title("Resource list pagination with explicit validation")
     @pytest.mark.pagination
@@ -223,9 +225,9 @@ class TestPerformanceWithSchemas:
     @pytest.mark.parametrize("delay", [1, 2])
     def test_delayed_response_control(self, api, delay):
         """Проверка функциональности задержанного ответа API"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = api.users().list(page=1, size=6, delay=delay).validate_users_list()
-        actual_duration = time.time() - start_time
+        actual_duration = time.perf_counter() - start_time
 
         # Проверка времени после валидации схемы
         assert (
@@ -243,12 +245,13 @@ class TestPerformanceWithSchemas:
         )
 
         logger.info(
-            f"Delayed response validated: {actual_duration:.2f}s (requested: {delay}s)"
+            "Delayed response validated: %.2fs (requested: %ss)", actual_duration, delay
         )
 
 
 @allure.feature("Business Rules")
 @pytest.mark.crud
+@pytest.mark.xdist_group("db_state")
 class TestBusinessRulesWithSchemas:
     """Проверка бизнес-правил и целостности данных с явной валидацией"""
 
@@ -266,15 +269,14 @@ class TestBusinessRulesWithSchemas:
                 user_ids.append(user_id)
 
         with allure.step("Verify all users exist with schema validation"):
-            retrieved_ids = []
+            retrieved_ids = set()
             for user_id in user_ids:
                 response = api.users().get(user_id).validate_single_user()
-                user_data_dict = response.extract("data")
-                retrieved_ids.append(user_data_dict.get("id"))
-
-            assert len(set(retrieved_ids)) == len(
-                retrieved_ids
-            ), "All user IDs should be unique"
+                retrieved_id = response.extract("data").get("id")
+                assert (
+                    retrieved_id not in retrieved_ids
+                ), f"Duplicate user ID: {retrieved_id}"
+                retrieved_ids.add(retrieved_id)
 
         with allure.step("Verify users presence in list with schema validation"):
             response = api.users().list(page=1, size=50).validate_users_list()
@@ -286,7 +288,7 @@ class TestBusinessRulesWithSchemas:
                     user_id in all_user_ids
                 ), f"User {user_id} should be in users list"
 
-        logger.info(f"Data consistency validated across {len(user_ids)} users")
+        logger.info("Data consistency validated across %s users", len(user_ids))
 
     @allure.title("Parallel operations safety with explicit validation")
     def test_parallel_operations_safety(
@@ -317,5 +319,5 @@ class TestBusinessRulesWithSchemas:
                 ), f"Resource {resource_id} name mismatch"
 
         logger.info(
-            f"Parallel operations safety validated for {len(resource_ids)} resources"
+            "Parallel operations safety validated for %s resources", len(resource_ids)
         )
@@ -62,7 +62,9 @@ class TestAuth:
         APIAssertions.check_email_error_response(
             response, "/api/register", "Invalid email format"
         )
-        logger.info(f"Registration correctly failed for invalid email: {invalid_email}")
+        logger.info(
+            "Registration correctly failed for invalid email: %s", invalid_email
+        )
 
     @allure.title("Login with invalid email formats")
     @pytest.mark.parametrize(
@@ -83,7 +85,7 @@ class TestAuth:
         APIAssertions.check_email_error_response(
             response, "/api/login", "Invalid email format"
         )
-        logger.info(f"Login correctly failed for invalid email: {invalid_email}")
+        logger.info("Login correctly failed for invalid email: %s", invalid_email)
 
     @allure.title("Register without email field")
     def test_register_missing_email(self, api_client) -> None:
@@ -1,7 +1,6 @@
 import allure
 import logging
 import pytest
-import random
 from mimesis import Text, Numeric
 from tests.assertions import APIAssertions
 
@@ -24,6 +23,7 @@ def generate_random_resource():
 
 @allure.feature("Resources CRUD Operations")
 @pytest.mark.crud
+@pytest.mark.xdist_group("db_state")
 class TestResourcesCRUD:
     """Тесты CRUD операций для ресурсов с проверкой БД"""
 
@@ -31,7 +31,7 @@ class TestResourcesCRUD:
     def test_create_resource(self, api_client) -> None:
         """Тест создания ресурса (API + БД)"""
         resource_data = generate_random_resource()
-        logger.info(f"Creating resource with data: {resource_data}")
+        logger.info("Creating resource with data: %s", resource_data)
 
         response = api_client.post("/api/resources", json=resource_data)
 
@@ -44,7 +44,7 @@ class TestResourcesCRUD:
         logger.info("Resource created and verified in database successfully")
 
     @allure.title("Read existing resource by ID")
-    def test_read_resource(self, api_client) -> None:
+    def test_read_resource(self, api_client, rng) -> None:
         """Тест чтения случайного ресурса"""
         # Получаем список ресурсов
         response = api_client.get("/api/resources", params={"page": 1, "size": 50})
@@ -54,7 +54,7 @@ class TestResourcesCRUD:
 
         if resources_page.items:
             # Выбираем случайный ресурс из списка
-            random_resource = random.choice(resources_page.items)
+            random_resource = rng.choice(resources_page.items)
             resource_id = random_resource.id
 
             # Читаем этот случайный ресурс
@@ -62,7 +62,7 @@ class TestResourcesCRUD:
             APIAssertions.check_resource_response(
                 response, f"/api/resources/{resource_id}"
             )
-            logger.info(f"Random resource {resource_id} read successfully")
+            logger.info("Random resource %s read successfully", resource_id)
         else:
             logger.warning("No resources found in database for read test")
 
@@ -79,7 +79,7 @@ class TestResourcesCRUD:
 
         # Обновляем его
         updated_data = generate_random_resource()
-        logger.info(f"Updating resource {resource_id} with data: {updated_data}")
+        logger.info("Updating resource %s with data: %s", resource_id, updated_data)
 
         response = api_client.put(f"/api/resources/{resource_id}", json=updated_data)
 
@@ -90,7 +90,7 @@ class TestResourcesCRUD:
             response, f"/api/resources/{resource_id}", updated_data, resource_id
         )
         logger.info(
-            f"Resource {resource_id} updated and verified in database successfully"
+            "Resource %s updated and verified in database successfully", resource_id
         )
 
     @allure.title("Update resource with PATCH method")
@@ -106,14 +106,14 @@ class TestResourcesCRUD:
 
         # Обновляем его
         updated_data = generate_random_resource()
-        logger.info(f"Patching resource {resource_id} with data: {updated_data}")
+        logger.info("Patching resource %s with data: %s", resource_id, updated_data)
 
         response = api_client.patch(f"/api/resources/{resource_id}", json=updated_data)
         APIAssertions.check_update_resource_response(
             response, f"/api/resources/{resource_id}", updated_data, resource_id
         )
         logger.info(
-            f"Resource {resource_id} patched and verified in database successfully"
+            "Resource %s patched and verified in database successfully", resource_id
         )
 
     @allure.title("Delete resource from system")
@@ -137,14 +137,14 @@ class TestResourcesCRUD:
             response, f"/api/resources/{resource_id}", resource_id
         )
         logger.info(
-            f"Resource {resource_id} deleted and verified removed from database"
+            "Resource %s deleted and verified removed from database", resource_id
         )
 
     @allure.title("Update non-existent resource")
     def test_update_nonexistent_resource(self, api_client) -> None:
         """Тест обновления несуществующего ресурса"""
         updated_data = generate_random_resource()
-        logger.info(f"Updating non-existent resource with data: {updated_data}")
+        logger.info("Updating non-existent resource with data: %s", updated_data)
 
         response = api_client.put("/api/resources/999999", json=updated_data)
         # curl автоматически появится при ошибке 404
@@ -191,7 +191,8 @@ class TestResourcesCRUD:
         APIAssertions.check_404_error(get_after_delete, f"/api/resources/{resource_id}")
 
         logger.info(
-            f"Full CRUD cycle with database verification completed for resource {resource_id}"
+            "Full CRUD cycle with database verification completed for resource %s",
+            resource_id,
         )
 
     @allure.title("Multiple resources CRUD operations")
@@ -207,7 +208,9 @@ class TestResourcesCRUD:
                 response, "/api/resources", test_resource_data
             )
             created_resources.append((int(created_resource["id"]), test_resource_data))
-            logger.info(f"Created resource {i + 1}/3 with ID {created_resource['id']}")
+            logger.info(
+                "Created resource %s/3 with ID %s", i + 1, created_resource["id"]
+            )
 
         # Проверяем что все существуют в БД
         for resource_id, expected_resource_data in created_resources:
@@ -221,6 +224,6 @@ class TestResourcesCRUD:
             APIAssertions.check_delete_resource_response(
                 response, f"/api/resources/{resource_id}", resource_id
             )
-            logger.info(f"Deleted resource {resource_id}")
+            logger.info("Deleted resource %s", resource_id)
 
         logger.info("Multiple resources CRUD test completed successfully")
@@ -1,23 +1,45 @@
 import allure
+import functools
+import itertools
 import logging
 import pytest
-import random
-from mimesis import Person
+from typing import Dict, Iterator
+from mimesis import Fieldset, Locale
 from tests.assertions import APIAssertions
 
 logger = logging.getLogger(__name__)
 
-# Инициализируем генератор
-person = Person()
+# Пул создается лениво, чтобы импорт модуля не загружал данные локали mimesis.
+# Фиксированный seed дает одинаковые данные при каждом запуске
+POOL_SIZE = 16
+POOL_SEED = 0xDEADBEEF
 
 
-def generate_random_user():
-    """Генерирует случайные тестовые данные пользователя с помощью mimesis"""
-    return {"name": person.first_name().lower(), "job": person.occupation().lower()}
+@functools.cache
+def _user_pool() -> Iterator[Dict[str, str]]:
+    """Пакетно генерирует пул пользователей и возвращает бесконечный цикл по нему"""
+    fieldset = Fieldset(locale=Locale.EN, i=POOL_SIZE, seed=POOL_SEED)
+    names = fieldset("person.first_name")
+    jobs = fieldset("person.occupation")
+    users = [
+        {"name": name.lower(), "job": job.lower()} for name, job in zip(names, jobs)
+    ]
+    return itertools.cycle(users)
+
+
+def generate_random_user() -> Dict[str, str]:
+    """Возвращает следующие тестовые данные пользователя из пула mimesis"""
+    # Копия, чтобы изменения в тесте не попали в общий пул
+    return dict(next(_user_pool()))
+
+
+# Данные для запросов к несуществующему пользователю: важен только ответ 404
+NONEXISTENT_USER_DATA = {"name": "ghost", "job": "nobody"}
 
 
 @allure.feature("Users CRUD Operations")
 @pytest.mark.crud
+@pytest.mark.xdist_group("db_state")
 class TestUsersCRUD:
     """Тесты для создания, обновления, удаления с проверкой БД"""
 
@@ -25,7 +47,7 @@ class TestUsersCRUD:
     def test_create_user(self, api_client) -> None:
         """Тест создания пользователя (API + БД)"""
         user_info = generate_random_user()
-        logger.info(f"Creating user with data: {user_info}")
+        logger.info("Creating user with data: %s", user_info)
 
         response = api_client.post("/api/users", json=user_info)
 
@@ -38,28 +60,23 @@ class TestUsersCRUD:
         logger.info("User created and verified in database successfully")
 
     @allure.title("Read existing user by ID")
-    def test_read_user(self, api_client) -> None:
+    def test_read_user(self, api_client, users_page, rng) -> None:
         """Тест чтения случайного пользователя"""
-        # Получаем список пользователей
-        response = api_client.get("/api/users", params={"page": 1, "size": 50})
-        users_page = APIAssertions.check_users_list_response(
-            response, "/api/users", page=1, per_page=50
-        )
-
         if users_page.items:
-            random_user = random.choice(users_page.items)
+            random_user = rng.choice(users_page.items)
             user_id = random_user.id
+            path = f"/api/users/{user_id}"
 
             # Читаем этого случайного пользователя
-            response = api_client.get(f"/api/users/{user_id}")
-            APIAssertions.check_user_response(response, f"/api/users/{user_id}")
-            logger.info(f"Random user {user_id} read successfully")
+            response = api_client.get(path)
+            APIAssertions.check_user_response(response, path)
+            logger.info("Random user %s read successfully", user_id)
         else:
             logger.warning("No users found in database for read test")
 
-    @allure.title("Update user with PUT method")
-    def test_update_user_put(self, api_client) -> None:
-        """Тест полного обновления пользователя (API + БД)"""
+    @allure.title("Update user with PUT and PATCH methods")
+    def test_update_flow(self, api_client) -> None:
+        """Тест полного и частичного обновления одного пользователя (API + БД)"""
         user_info = generate_random_user()
 
         # Создаем пользователя
@@ -67,59 +84,40 @@ class TestUsersCRUD:
         created_user = APIAssertions.check_create_user_response(
             create_response, "/api/users", user_info["name"], user_info["job"]
         )
-        user_id = int(created_user.id)
+        user_id = created_user.id
+        path = f"/api/users/{user_id}"
 
         # Получаем исходные данные из БД для проверки
         original_user = APIAssertions.check_user_in_database(user_id)
 
-        # Обновляем его
-        updated_info = generate_random_user()
-        logger.info(f"Updating user {user_id} with data: {updated_info}")
-
-        response = api_client.put(f"/api/users/{user_id}", json=updated_info)
-
-        # Логируем curl для документации обновления пользователя
-        APIAssertions.log_curl_command(response, f"🔄 Update User {user_id}")
-
-        APIAssertions.check_update_user_response(
-            response,
-            f"/api/users/{user_id}",
-            updated_info["name"],
-            updated_info["job"],
-            user_id,
-            original_user,
-        )
-        logger.info(f"User {user_id} updated and verified in database successfully")
-
-    @allure.title("Update user with PATCH method")
-    def test_update_user_patch(self, api_client) -> None:
-        """Тест частичного обновления пользователя (API + БД)"""
-        user_info = generate_random_user()
-
-        # Создаем пользователя
-        create_response = api_client.post("/api/users", json=user_info)
-        created_user = APIAssertions.check_create_user_response(
-            create_response, "/api/users", user_info["name"], user_info["job"]
-        )
-        user_id = int(created_user.id)
-
-        # Получаем исходные данные из БД
-        original_user = APIAssertions.check_user_in_database(user_id)
-
-        # Обновляем его
-        updated_info = generate_random_user()
-        logger.info(f"Patching user {user_id} with data: {updated_info}")
-
-        response = api_client.patch(f"/api/users/{user_id}", json=updated_info)
-        APIAssertions.check_update_user_response(
-            response,
-            f"/api/users/{user_id}",
-            updated_info["name"],
-            updated_info["job"],
-            user_id,
-            original_user,
-        )
-        logger.info(f"User {user_id} patched and verified in database successfully")
+        # Полное (PUT) и частичное (PATCH) обновление того же пользователя
+        for verb in ("put", "patch"):
+            with allure.step(f"{verb.upper()} user {user_id}"):
+                updated_info = generate_random_user()
+                logger.info(
+                    "%s user %s with data: %s", verb.upper(), user_id, updated_info
+                )
+
+                response = getattr(api_client, verb)(path, json=updated_info)
+
+                # Логируем curl для документации обновления пользователя
+                APIAssertions.log_curl_command(
+                    response, f"🔄 {verb.upper()} User {user_id}"
+                )
+
+                APIAssertions.check_update_user_response(
+                    response,
+                    path,
+                    updated_info["name"],
+                    updated_info["job"],
+                    user_id,
+                    original_user,
+                )
+                logger.info(
+                    "User %s %s verified in database successfully",
+                    user_id,
+                    verb.upper(),
+                )
 
     @allure.title("Delete user from system")
     def test_delete_user(self, api_client) -> None:
@@ -131,37 +129,33 @@ class TestUsersCRUD:
         created_user = APIAssertions.check_create_user_response(
             create_response, "/api/users", user_info["name"], user_info["job"]
         )
-        user_id = int(created_user.id)
+        user_id = created_user.id
+        path = f"/api/users/{user_id}"
 
         # Удаляем его
-        response = api_client.delete(f"/api/users/{user_id}")
+        response = api_client.delete(path)
 
         # Логируем curl для документации удаления пользователя
         APIAssertions.log_curl_command(response, f"🗑️ Delete User {user_id}")
 
-        APIAssertions.check_delete_user_response(
-            response, f"/api/users/{user_id}", user_id
-        )
-        logger.info(f"User {user_id} deleted and verified removed from database")
-
-    @allure.title("Update non-existent user")
-    def test_update_nonexistent_user(self, api_client) -> None:
-        """Тест обновления несуществующего пользователя"""
-        updated_info = generate_random_user()
-        logger.info(f"Updating non-existent user with data: {updated_info}")
-
-        response = api_client.put("/api/users/999999", json=updated_info)
+        APIAssertions.check_delete_user_response(response, path, user_id)
+        logger.info("User %s deleted and verified removed from database", user_id)
+
+    @allure.title("Non-existent user {method} returns 404")
+    @pytest.mark.parametrize(
+        "method,path",
+        [("put", "/api/users/999999"), ("delete", "/api/users/999999")],
+        ids=["put", "delete"],
+    )
+    def test_404_errors(self, api_client, method: str, path: str) -> None:
+        """Тест обновления и удаления несуществующего пользователя"""
+        kwargs = {"json": NONEXISTENT_USER_DATA} if method == "put" else {}
+        logger.info("%s non-existent user with data: %s", method.upper(), kwargs)
+
+        response = getattr(api_client, method)(path, **kwargs)
         # curl автоматически появится при ошибке 404
-        APIAssertions.check_404_error(response, "/api/users/999999")
-        logger.info("Non-existent user correctly failed with 404")
-
-    @allure.title("Delete non-existent user")
-    def test_delete_nonexistent_user(self, api_client) -> None:
-        """Тест удаления несуществующего пользователя"""
-        response = api_client.delete("/api/users/999999")
-        # curl автоматически появится при ошибке 404
-        APIAssertions.check_404_error(response, "/api/users/999999")
-        logger.info("Non-existent user DELETE correctly failed with 404")
+        APIAssertions.check_404_error(response, path)
+        logger.info("Non-existent user %s correctly failed with 404", method.upper())
 
     @allure.title("Full CRUD cycle for user")
     def test_create_and_delete_flow(self, api_client) -> None:
@@ -173,26 +167,25 @@ class TestUsersCRUD:
         created_user = APIAssertions.check_create_user_response(
             create_response, "/api/users", user_info["name"], user_info["job"]
         )
-        user_id = int(created_user.id)
+        user_id = created_user.id
+        path = f"/api/users/{user_id}"
 
         # Проверяем что пользователь существует в БД
         APIAssertions.check_user_in_database(user_id, user_info["name"])
 
         # Проверяем что пользователь доступен через API
-        get_response = api_client.get(f"/api/users/{user_id}")
-        APIAssertions.check_user_response(get_response, f"/api/users/{user_id}")
+        get_response = api_client.get(path)
+        APIAssertions.check_user_response(get_response, path)
 
         # Удаляем пользователя
-        delete_response = api_client.delete(f"/api/users/{user_id}")
-        APIAssertions.check_delete_user_response(
-            delete_response, f"/api/users/{user_id}", user_id
-        )
+        delete_response = api_client.delete(path)
+        APIAssertions.check_delete_user_response(delete_response, path, user_id)
 
         # Проверяем что пользователь удален из API
-        get_after_delete = api_client.get(f"/api/users/{user_id}")
+        get_after_delete = api_client.get(path)
         # curl автоматически появится при ошибке 404
-        APIAssertions.check_404_error(get_after_delete, f"/api/users/{user_id}")
+        APIAssertions.check_404_error(get_after_delete, path)
 
         logger.info(
-            f"Full CRUD cycle with database verification completed for user {user_id}"
+            "Full CRUD cycle with database verification completed for user %s", user_id
         )
@@ -10,25 +10,25 @@ class TestDemoStatuses:
     """Демонстрация различных статусов тестов для Allure отчета"""
 
     @allure.title("Test that should pass")
-    def test_pass_example(self, api_client) -> None:
+    def test_pass_example(self, status_client) -> None:
         """Обычный проходящий тест"""
-        response = api_client.get("/status")
+        response = status_client()
         assert response.status_code == 200
         logger.info("This test passed as expected")
 
     @allure.title("Test that should be skipped")
     @pytest.mark.skip(reason="Демонстрация skip статуса для Allure отчета")
-    def test_skip_example(self, api_client) -> None:
+    def test_skip_example(self) -> None:
         """Пропущенный тест"""
         # Этот код не выполнится
         assert False, "This should not run"
 
     @allure.title("Test expected to fail but might pass")
     @pytest.mark.xfail(reason="Демонстрация xfail статуса - ожидаем падение")
-    def test_xfail_example(self, api_client) -> None:
+    def test_xfail_example(self, status_client) -> None:
         """Тест который должен упасть, но может пройти"""
         # Намеренно делаем тест который может как пройти, так и упасть
-        response = api_client.get("/status")
+        response = status_client()
         # Проверяем что статус НЕ health
         data = response.json()
         assert data["status"] != "healthy", "Expected status to NOT be healthy"
@@ -37,9 +37,9 @@ class TestDemoStatuses:
     @pytest.mark.xfail(
         reason="Демонстрация xpass статуса - ожидаем падение, но тест проходит"
     )
-    def test_xpass_example(self, api_client) -> None:
+    def test_xpass_example(self, status_client) -> None:
         """Тест который помечен как ожидаемое падение, но на самом деле проходит"""
-        response = api_client.get("/status")
+        response = status_client()
 
         # Проверяем что статус код корректный
         assert response.status_code == 200, "Status code should be 200"
@@ -51,9 +51,9 @@ class TestDemoStatuses:
         logger.info("This test was expected to fail but actually passed (XPASS)")
 
     @allure.title("Test that will definitely fail")
-    def test_fail_example(self, api_client) -> None:
+    def test_fail_example(self, status_client) -> None:
         """Тест который обязательно упадет"""
-        response = api_client.get("/status")
+        response = status_client()
 
         # Намеренно неправильная проверка чтобы тест упал
         assert (
@@ -13,15 +13,10 @@ class TestResources:
 
     @allure.title("Get resources list with pagination")
     @pytest.mark.pagination
-    def test_list_resources(self, api_client) -> None:
+    def test_list_resources(self, resources_page_1) -> None:
         """Тест списка ресурсов"""
-        response = api_client.get("/api/resources", params={"page": 1, "size": 6})
-        resources_response = APIAssertions.check_resources_list_response(
-            response, "/api/resources"
-        )
-
         APIAssertions.check_multiple_fields(
-            resources_response.items[0], name="cerulean", year=2000
+            resources_page_1.items[0], name="cerulean", year=2000
         )
         logger.info("Resources list works, schema valid")
 
@@ -32,13 +27,16 @@ class TestResources:
         APIAssertions.check_resource_response(response, "/api/resources/2")
         logger.info("Resource 2 found, schema valid")
 
-    @allure.title("Get non-existent resource by ID")
-    @pytest.mark.parametrize("resource_id", [999999, 888888, 777777])
-    def test_single_resource_not_found(self, api_client, resource_id: int) -> None:
-        """Тест получения несуществующего ресурса"""
-        response = api_client.get(f"/api/resources/{resource_id}")
-        APIAssertions.check_404_error(response, f"/api/resources/{resource_id}")
-        logger.info(f"Resource {resource_id} not found (404)")
+    @allure.title("Get non-existent resources by ID")
+    def test_single_resource_not_found(self, api_client) -> None:
+        """Тест получения несуществующих ресурсов"""
+        resource_ids = [999999, 888888, 777777]
+        paths = [f"/api/resources/{resource_id}" for resource_id in resource_ids]
+        responses = api_client.get_many([(path, None) for path in paths])
+
+        for path, response in zip(paths, responses):
+            APIAssertions.check_404_error(response, path)
+        logger.info("Resources %s not found (404)", resource_ids)
 
     @allure.title("Get resources list - second page")
     @pytest.mark.pagination
@@ -64,76 +62,75 @@ class TestResources:
 
         # Проверяем уникальность ID
         APIAssertions.check_unique_ids(resources_page.items, "resource")
-        logger.info(f"All {len(resources_page.items)} resource IDs are unique")
+        logger.info("All %s resource IDs are unique", len(resources_page.items))
 
     @allure.title("Verify pagination calculations and item counts")
     @pytest.mark.pagination
-    @pytest.mark.parametrize("page,size", [(1, 1), (1, 6), (2, 6), (1, 12), (1, 50)])
-    def test_pagination_calculations(self, api_client, page: int, size: int) -> None:
+    def test_pagination_calculations(self, api_client) -> None:
         """Проверка корректности расчетов пагинации и количества элементов"""
-        response = api_client.get("/api/resources", params={"page": page, "size": size})
-        resources_page = APIAssertions.check_resources_list_response(
-            response,
-            f"/api/resources?page={page}&size={size}",
-            page=page,
-            per_page=size,
+        cases = [(1, 1), (1, 6), (2, 6), (1, 12), (1, 50)]
+        responses = api_client.get_many(
+            [("/api/resources", {"page": page, "size": size}) for page, size in cases]
         )
 
-        APIAssertions.check_pagination_pages_calculation(resources_page, size)
-        APIAssertions.check_pagination_items_count(resources_page, page, size)
-
-        logger.info(
-            f"Pagination calculations correct: page={page}, size={size}, "
-            f"items={len(resources_page.items)}, pages={resources_page.pages}"
-        )
+        for (page, size), response in zip(cases, responses):
+            with allure.step(f"page={page} size={size}"):
+                resources_page = APIAssertions.check_resources_list_response(
+                    response,
+                    f"/api/resources?page={page}&size={size}",
+                    page=page,
+                    per_page=size,
+                )
+
+                APIAssertions.check_pagination_pages_calculation(resources_page, size)
+                APIAssertions.check_pagination_items_count(resources_page, page, size)
+
+                logger.info(
+                    "Pagination calculations correct: page=%s, size=%s, items=%s, pages=%s",
+                    page,
+                    size,
+                    len(resources_page.items),
+                    resources_page.pages,
+                )
 
     @allure.title("Verify different pages return different data")
     @pytest.mark.pagination
-    def test_pagination_different_pages(self, api_client) -> None:
+    def test_pagination_different_pages(self, api_client, resources_page_1) -> None:
         """Проверка уникальности данных на различных страницах"""
-        response = api_client.get("/api/resources", params={"page": 1, "size": 6})
-        first_page = APIAssertions.check_resources_list_response(
-            response, "/api/resources?page=1", page=1, per_page=6
-        )
+        first_page = resources_page_1
 
-        if first_page.total > 6 and first_page.pages > 1:
-            response = api_client.get("/api/resources", params={"page": 2, "size": 6})
-            second_page = APIAssertions.check_resources_list_response(
-                response, "/api/resources?page=2", page=2, per_page=6
-            )
+        # Решение о пропуске принимается по закешированной странице, без запроса
+        if first_page.total <= 6 or first_page.pages <= 1:
+            pytest.skip("Insufficient data for different pages test")
 
-            APIAssertions.check_pagination_different_data(
-                first_page.items, second_page.items, "resource"
-            )
-            logger.info("Different pages contain different data and unique IDs")
-        else:
-            logger.info("Skipped different pages test - insufficient data")
+        response = api_client.get("/api/resources", params={"page": 2, "size": 6})
+        second_page = APIAssertions.check_resources_list_response(
+            response, "/api/resources?page=2", page=2, per_page=6
+        )
+
+        APIAssertions.check_pagination_different_data(
+            first_page.items, second_page.items, "resource"
+        )
+        logger.info("Different pages contain different data and unique IDs")
 
     @allure.title("Invalid pagination parameters should be rejected")
     @pytest.mark.pagination
-    @pytest.mark.parametrize("page,size", [(0, 6), (-1, 6), (1, 0), (1, -5)])
     def test_pagination_invalid_parameters(
-        self, api_client, page: int, size: int
+        self, api_client, invalid_pagination_case
     ) -> None:
         """Проверка валидации параметров пагинации"""
-        response = api_client.get("/api/resources", params={"page": page, "size": size})
-
+        case = invalid_pagination_case
+        response = api_client.get("/api/resources", params=case.params)
         APIAssertions.log_and_check_status(
-            response,
-            f"/api/resources?page={page}&size={size}",
-            HTTPStatus.UNPROCESSABLE_ENTITY,
+            response, f"/api/resources{case.query}", HTTPStatus.UNPROCESSABLE_ENTITY
         )
-
-        logger.info(f"Invalid pagination correctly rejected: page={page}, size={size}")
+        logger.info("Invalid pagination correctly rejected: %s", case.params)
 
     @allure.title("Page beyond available returns empty results")
     @pytest.mark.pagination
-    def test_pagination_beyond_available(self, api_client) -> None:
+    def test_pagination_beyond_available(self, api_client, resources_page_1) -> None:
         """Проверка поведения при запросе несуществующей страницы"""
-        response = api_client.get("/api/resources", params={"page": 1, "size": 6})
-        resources_page = APIAssertions.check_resources_list_response(
-            response, "/api/resources", page=1, per_page=6
-        )
+        resources_page = resources_page_1
 
         beyond_page = resources_page.pages + 5
         response = api_client.get(
@@ -145,5 +142,7 @@ class TestResources:
 
         APIAssertions.check_pagination_empty_page(beyond_page_response)
         logger.info(
-            f"Page {beyond_page} beyond {resources_page.pages} correctly returns empty"
+            "Page %s beyond %s correctly returns empty",
+            beyond_page,
+            resources_page.pages,
         )
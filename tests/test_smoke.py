@@ -12,23 +12,22 @@ class TestSmoke:
     """Smoke тесты - проверка доступности сервиса"""
 
     @allure.title("Service responds to requests")
-    def test_service_is_alive(self, api_client) -> None:
+    def test_service_is_alive(self, status_response) -> None:
         """Сервис отвечает на запросы"""
-        response = api_client.get("/status")
-
         # Логируем curl для мониторинга
-        APIAssertions.log_curl_command(response, "🔍 Health Check for Monitoring")
+        APIAssertions.log_curl_command(
+            status_response, "🔍 Health Check for Monitoring"
+        )
 
-        APIAssertions.log_and_check_status(response, "/status")
+        APIAssertions.log_and_check_status(status_response, "/status")
         logger.info("Service is alive and responding")
 
     @allure.title("Application status endpoint returns valid data")
-    def test_app_status(self, api_client) -> None:
+    def test_app_status(self, status_response) -> None:
         """Проверка статуса приложения"""
-        response = api_client.get("/status")
-        APIAssertions.log_and_check_status(response, "/status")
+        APIAssertions.log_and_check_status(status_response, "/status")
 
-        status = response.json()
+        status = status_response.json()
 
         assert status["status"] in ["healthy", "unhealthy"], "Invalid status value"
         assert status["data"]["users"]["loaded"] is True, "Users data not loaded"
@@ -41,11 +40,11 @@ class TestSmoke:
     def test_main_endpoints_accessible(self, api_client) -> None:
         """Основные эндпоинты доступны"""
         endpoints = ["/api/users", "/api/resources"]
+        responses = api_client.get_many([(endpoint, None) for endpoint in endpoints])
 
-        for endpoint in endpoints:
-            response = api_client.get(endpoint)
+        for endpoint, response in zip(endpoints, responses):
             APIAssertions.log_and_check_status(response, endpoint)
-            logger.info(f"Endpoint {endpoint} is accessible")
+            logger.info("Endpoint %s is accessible", endpoint)
 
     @allure.title("Service returns valid data structure")
     def test_service_info(self, api_client) -> None:
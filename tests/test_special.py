@@ -13,20 +13,20 @@ class TestSpecial:
     """Специальные тесты"""
 
     @allure.title("Test delayed response functionality")
-    @pytest.mark.parametrize("delay_seconds", [1, 2])
+    @pytest.mark.parametrize("delay_seconds", [1, 2], ids=["d1", "d2"])
     def test_delayed_response(self, api_client, delay_seconds: int) -> None:
         """Тест задержанного ответа"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         response = api_client.get(
             "/api/users", params={"delay": delay_seconds, "size": 6}
         )
-        actual_duration = time.time() - start_time
+        actual_duration = time.perf_counter() - start_time
 
         APIAssertions.check_delayed_response(
             response, f"/api/users?delay={delay_seconds}", delay_seconds
         )
 
         logger.info(
-            f"Delayed response: {actual_duration:.2f}s (requested: {delay_seconds}s)"
+            "Delayed response: %.2fs (requested: %ss)", actual_duration, delay_seconds
         )
@@ -13,15 +13,16 @@ class TestUsers:
 
     @allure.title("Get users list - first page")
     @pytest.mark.pagination
-    def test_list_users_page_1(self, api_client) -> None:
+    def test_list_users_page_1(self, users_page_1) -> None:
         """Тест первой страницы"""
-        response = api_client.get("/api/users", params={"page": 1, "size": 6})
-        users_page = APIAssertions.check_users_list_response(
-            response, "/api/users?page=1", page=1, per_page=6
-        )
+        # Ответ уже провалидирован в session-фикстуре
+        assert users_page_1.page == 1, f"Expected page 1, got {users_page_1.page}"
+        assert users_page_1.items, "First page should not be empty"
 
         logger.info(
-            f"Page 1 works, got {len(users_page.items)} users, total: {users_page.total}"
+            "Page 1 works, got %s users, total: %s",
+            len(users_page_1.items),
+            users_page_1.total,
         )
 
     @allure.title("Get users list - second page")
@@ -33,7 +34,7 @@ class TestUsers:
             response, "/api/users?page=2", page=2, per_page=6
         )
 
-        logger.info(f"Page 2 works, got {len(users_page.items)} users")
+        logger.info("Page 2 works, got %s users", len(users_page.items))
 
     @allure.title("Verify unique user IDs")
     def test_users_no_duplicates(self, api_client) -> None:
@@ -45,135 +46,131 @@ class TestUsers:
 
         # Проверяем уникальность ID
         APIAssertions.check_unique_ids(users_page.items, "user")
-        logger.info(f"All {len(users_page.items)} user IDs are unique")
+        logger.info("All %s user IDs are unique", len(users_page.items))
 
     @allure.title("Get single user by ID")
-    def test_single_user_exists(self, api_client) -> None:
+    def test_single_user_exists(self, api_client, created_user: int) -> None:
         """Тест получения существующего пользователя"""
-        # Сначала создаем пользователя для теста
-        test_user = {"name": "TestUser", "job": "TestJob"}
-        create_response = api_client.post("/api/users", json=test_user)
-        APIAssertions.check_create_user_response(
-            create_response, "/api/users", test_user["name"], test_user["job"]
-        )
-
-        created_user = create_response.json()
-        user_id = int(created_user["id"])
-
-        # Теперь проверяем что можем получить этого пользователя
-        response = api_client.get(f"/api/users/{user_id}")
-        APIAssertions.check_user_response(response, f"/api/users/{user_id}")
-        logger.info(f"Created and verified user {user_id}")
-
-    @allure.title("Get non-existent user by ID")
-    @pytest.mark.parametrize("user_id", [1000000, 999999, 888888])
-    def test_single_user_not_found(self, api_client, user_id: int) -> None:
-        """Тест получения несуществующего пользователя"""
-        response = api_client.get(f"/api/users/{user_id}")
-        APIAssertions.check_404_error(response, f"/api/users/{user_id}")
-        logger.info(f"User {user_id} not found (404)")
-
-    @allure.title("Get user with invalid ID")
-    @pytest.mark.parametrize("user_id", [0, -1, -999])
-    def test_single_user_invalid_id(self, api_client, user_id: int) -> None:
-        """Тест невалидного ID пользователя"""
-        response = api_client.get(f"/api/users/{user_id}")
-        APIAssertions.log_and_check_status(
-            response, f"/api/users/{user_id}", HTTPStatus.UNPROCESSABLE_ENTITY
-        )
-        logger.info(f"Invalid user ID {user_id} correctly rejected (422)")
+        # Пользователь создан session-фикстурой, проверяем что можем его получить
+        path = f"/api/users/{created_user}"
+        response = api_client.get(path)
+        APIAssertions.check_user_response(response, path)
+        logger.info("Created and verified user %s", created_user)
+
+    @allure.title("Get non-existent users by ID")
+    def test_single_user_not_found(self, api_client) -> None:
+        """Тест получения несуществующих пользователей"""
+        user_ids = [1000000, 999999, 888888]
+        paths = [f"/api/users/{user_id}" for user_id in user_ids]
+        responses = api_client.get_many([(path, None) for path in paths])
+
+        for path, response in zip(paths, responses):
+            APIAssertions.check_404_error(response, path)
+        logger.info("Users %s not found (404)", user_ids)
+
+    @allure.title("Get users with invalid IDs")
+    def test_single_user_invalid_id(self, api_client) -> None:
+        """Тест невалидных ID пользователей"""
+        user_ids = [0, -1, -999]
+        paths = [f"/api/users/{user_id}" for user_id in user_ids]
+        responses = api_client.get_many([(path, None) for path in paths])
+
+        for path, response in zip(paths, responses):
+            APIAssertions.log_and_check_status(
+                response, path, HTTPStatus.UNPROCESSABLE_ENTITY
+            )
+        logger.info("Invalid user IDs %s correctly rejected (422)", user_ids)
 
     @allure.title("Get any existing user from list")
-    def test_dynamic_user_exists(self, api_client) -> None:
+    def test_dynamic_user_exists(self, api_client, users_page_1) -> None:
         """Тест получения любого существующего пользователя"""
-        # Получаем список пользователей
-        response = api_client.get("/api/users", params={"page": 1, "size": 1})
-        users_page = APIAssertions.check_users_list_response(
-            response, "/api/users", page=1, per_page=1
-        )
-
-        if users_page.items:
-            user_id = users_page.items[0].id
+        # Берем пользователя из закешированной первой страницы
+        if users_page_1.items:
+            user_id = users_page_1.items[0].id
             # Проверяем этого пользователя
-            response = api_client.get(f"/api/users/{user_id}")
-            APIAssertions.check_user_response(response, f"/api/users/{user_id}")
-            logger.info(f"Dynamic user {user_id} found, schema valid")
+            path = f"/api/users/{user_id}"
+            response = api_client.get(path)
+            APIAssertions.check_user_response(response, path)
+            logger.info("Dynamic user %s found, schema valid", user_id)
         else:
             logger.warning("No users found in database")
 
     @allure.title("Verify pagination calculations and item counts")
     @pytest.mark.pagination
-    @pytest.mark.parametrize("page,size", [(1, 1), (1, 6), (2, 6), (1, 12), (1, 50)])
-    def test_pagination_calculations(self, api_client, page: int, size: int) -> None:
+    def test_pagination_calculations(self, api_client) -> None:
         """Проверка корректности расчетов пагинации и количества элементов"""
-        response = api_client.get("/api/users", params={"page": page, "size": size})
-        users_page = APIAssertions.check_users_list_response(
-            response, f"/api/users?page={page}&size={size}", page=page, per_page=size
+        cases = [(1, 1), (1, 6), (2, 6), (1, 12), (1, 50)]
+        responses = api_client.get_many(
+            [("/api/users", {"page": page, "size": size}) for page, size in cases]
         )
 
-        APIAssertions.check_pagination_pages_calculation(users_page, size)
-        APIAssertions.check_pagination_items_count(users_page, page, size)
-
-        logger.info(
-            f"Pagination calculations correct: page={page}, size={size}, "
-            f"items={len(users_page.items)}, pages={users_page.pages}"
-        )
+        for (page, size), response in zip(cases, responses):
+            with allure.step(f"page={page} size={size}"):
+                users_page = APIAssertions.check_users_list_response(
+                    response,
+                    f"/api/users?page={page}&size={size}",
+                    page=page,
+                    per_page=size,
+                )
+
+                APIAssertions.check_pagination_pages_calculation(users_page, size)
+                APIAssertions.check_pagination_items_count(users_page, page, size)
+
+                logger.info(
+                    "Pagination calculations correct: page=%s, size=%s, items=%s, pages=%s",
+                    page,
+                    size,
+                    len(users_page.items),
+                    users_page.pages,
+                )
 
     @allure.title("Verify different pages return different data")
     @pytest.mark.pagination
-    def test_pagination_different_pages(self, api_client) -> None:
+    def test_pagination_different_pages(self, api_client, users_page_1) -> None:
         """Проверка уникальности данных на разных страницах пагинации"""
-        response = api_client.get("/api/users", params={"page": 1, "size": 6})
-        first_page = APIAssertions.check_users_list_response(
-            response, "/api/users?page=1", page=1, per_page=6
-        )
+        first_page = users_page_1
 
-        if first_page.total > 6 and first_page.pages > 1:
-            response = api_client.get("/api/users", params={"page": 2, "size": 6})
-            second_page = APIAssertions.check_users_list_response(
-                response, "/api/users?page=2", page=2, per_page=6
-            )
+        # Решение о пропуске принимается по закешированной странице, без запроса
+        if first_page.total <= 6 or first_page.pages <= 1:
+            pytest.skip("Insufficient data for different pages test")
 
-            APIAssertions.check_pagination_different_data(
-                first_page.items, second_page.items, "user"
-            )
-            logger.info("Different pages contain different data and unique IDs")
-        else:
-            logger.info("Skipped different pages test - insufficient data")
+        response = api_client.get("/api/users", params={"page": 2, "size": 6})
+        second_page = APIAssertions.check_users_list_response(
+            response, "/api/users?page=2", page=2, per_page=6
+        )
+
+        APIAssertions.check_pagination_different_data(
+            first_page.items, second_page.items, "user"
+        )
+        logger.info("Different pages contain different data and unique IDs")
 
     @allure.title("Invalid pagination parameters should be rejected")
     @pytest.mark.pagination
-    @pytest.mark.parametrize("page,size", [(0, 6), (-1, 6), (1, 0), (1, -5)])
     def test_pagination_invalid_parameters(
-        self, api_client, page: int, size: int
+        self, api_client, invalid_pagination_case
     ) -> None:
         """Проверка валидации параметров пагинации"""
-        from http import HTTPStatus
-
-        response = api_client.get("/api/users", params={"page": page, "size": size})
+        case = invalid_pagination_case
+        response = api_client.get("/api/users", params=case.params)
         APIAssertions.log_and_check_status(
-            response,
-            f"/api/users?page={page}&size={size}",
-            HTTPStatus.UNPROCESSABLE_ENTITY,
+            response, f"/api/users{case.query}", HTTPStatus.UNPROCESSABLE_ENTITY
         )
-        logger.info(f"Invalid pagination correctly rejected: page={page}, size={size}")
+        logger.info("Invalid pagination correctly rejected: %s", case.params)
 
     @allure.title("Page beyond available returns empty results")
     @pytest.mark.pagination
-    def test_pagination_beyond_available(self, api_client) -> None:
+    def test_pagination_beyond_available(self, api_client, users_page_1) -> None:
         """Проверка поведения при запросе несуществующей страницы"""
-        response = api_client.get("/api/users", params={"page": 1, "size": 6})
-        users_page = APIAssertions.check_users_list_response(
-            response, "/api/users", page=1, per_page=6
-        )
+        users_page = users_page_1
 
         beyond_page = users_page.pages + 5
         response = api_client.get("/api/users", params={"page": beyond_page, "size": 6})
-        beyond_page_response = APIAssertions.check_users_list_response(
-            response, f"/api/users?page={beyond_page}", page=beyond_page, per_page=6
-        )
+        APIAssertions.log_and_check_status(response, f"/api/users?page={beyond_page}")
 
-        APIAssertions.check_pagination_empty_page(beyond_page_response)
+        # Пустая страница проверяется по словарю, без построения модели Page[User]
+        data = APIAssertions.parse_json(response)
+        APIAssertions.check_pagination_structure(data, beyond_page, 6)
+        assert data["items"] == [], f"Expected empty items, got {len(data['items'])}"
         logger.info(
-            f"Page {beyond_page} beyond {users_page.pages} correctly returns empty"
+            "Page %s beyond %s correctly returns empty", beyond_page, users_page.pages
         )